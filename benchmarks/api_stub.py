@@ -0,0 +1,103 @@
+"""Local stand-in for the HVC Groep API used by the benchmarks."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import timedelta
+from unittest.mock import patch
+
+# Sets up the import path of custom_components when run from a checkout
+import common  # noqa: F401
+from aiohttp import web
+from homeassistant.util import dt as dt_util
+
+from custom_components.hvcgroep.const import GARBAGE_TYPES
+
+# Pickup interval in days per garbage type
+PICKUP_INTERVALS = {
+    "gft": 14,
+    "plastic": 14,
+    "papier": 28,
+    "restafval": 14,
+    "reiniging": 7,
+}
+
+
+class HVCGroepApiStub:
+    """Serve BAG IDs and recurring waste schedules for any address."""
+
+    def __init__(self) -> None:
+        """Initialize the stub."""
+        self.fail = False
+        self.requests = 0
+        self.failed_requests = 0
+        self._runner: web.AppRunner | None = None
+        self._port = 0
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the stub."""
+        return f"http://127.0.0.1:{self._port}/rest/adressen"
+
+    async def start(self) -> None:
+        """Start serving on a free local port."""
+        app = web.Application()
+        app.router.add_get("/rest/adressen/{bag_id}/afvalstromen", self._handle_schedule)
+        app.router.add_get("/rest/adressen/{address}", self._handle_address)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @contextmanager
+    def patch_urls(self) -> Iterator[None]:
+        """Point the integration at the stub instead of the HVC Groep API."""
+        with (
+            patch(
+                "custom_components.hvcgroep.coordinator.BAGID_URL",
+                f"{self.url}/{{0}}-{{1}}",
+            ),
+            patch(
+                "custom_components.hvcgroep.coordinator.WASTE_URL",
+                f"{self.url}/{{0}}/afvalstromen",
+            ),
+        ):
+            yield
+
+    def _check_request(self) -> None:
+        """Count the request and raise when failures are simulated."""
+        self.requests += 1
+        if self.fail:
+            self.failed_requests += 1
+            raise web.HTTPServiceUnavailable
+
+    async def _handle_address(self, request: web.Request) -> web.Response:
+        """Return the BAG ID for an address."""
+        self._check_request()
+        address = request.match_info["address"]
+        return web.json_response([{"bagId": f"bag-{address}"}])
+
+    async def _handle_schedule(self, request: web.Request) -> web.Response:
+        """Return the next pickup per garbage type, following a fixed recurrence."""
+        self._check_request()
+        today = dt_util.now().date()
+        items = []
+        for garbage_type, info in GARBAGE_TYPES.items():
+            # Pickups fall on the days whose ordinal is a multiple of the interval
+            interval = PICKUP_INTERVALS[garbage_type]
+            pickup_date = today + timedelta(days=-today.toordinal() % interval)
+            items.append(
+                {
+                    "id": info["id"],
+                    "title": garbage_type,
+                    "ophaaldatum": pickup_date.isoformat(),
+                }
+            )
+        return web.json_response(items)
@@ -0,0 +1,62 @@
+"""Shared helpers for the HVC Groep benchmarks."""
+from __future__ import annotations
+
+import sys
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+# Make custom_components.hvcgroep importable when run from a checkout
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aiohttp.resolver import AsyncResolver  # noqa: E402
+from homeassistant import loader  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.hvcgroep.const import (  # noqa: E402
+    CONF_HOUSE_NUMBER,
+    CONF_POSTAL_CODE,
+    DOMAIN,
+)
+
+
+def create_config_entry(
+    index: int, options: dict[str, Any] | None = None
+) -> MockConfigEntry:
+    """Create a config entry for a generated address."""
+    postal_code = f"{1000 + index // 26:04d}{chr(65 + index % 26)}A"
+    house_number = str(index + 1)
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=f"HVC Groep ({postal_code})",
+        data={CONF_POSTAL_CODE: postal_code, CONF_HOUSE_NUMBER: house_number},
+        options=options or {},
+        unique_id=f"{postal_code}_{house_number}",
+    )
+
+
+@asynccontextmanager
+async def async_hass() -> AsyncIterator[HomeAssistant]:
+    """Start a Home Assistant instance that can load this custom integration."""
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        # Same as the mock_zeroconf_resolver fixture, zeroconf is not set up here
+        patch(
+            "homeassistant.helpers.aiohttp_client._async_make_resolver",
+            return_value=AsyncResolver(),
+        ),
+    ):
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            hass.config.language = "nl"
+            # Same as the enable_custom_integrations fixture
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+            yield hass
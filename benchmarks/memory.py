@@ -0,0 +1,80 @@
+"""Measure memory used per HVC Groep config entry.
+
+Sets up a number of generated config entries against the local API stand-in
+the way Home Assistant does, so coordinators, entities, their states and
+registry entries are all included, and reports the traced allocation growth
+per 1000 entries. One entry is set up before measuring, so loading the
+integration and its platforms is not counted as per-entry memory.
+
+    python benchmarks/memory.py --entries 1000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+
+from api_stub import HVCGroepApiStub
+from common import async_hass, create_config_entry
+from homeassistant.setup import async_setup_component
+
+from custom_components.hvcgroep.const import DOMAIN
+
+
+async def async_main(count: int) -> None:
+    """Run the memory benchmark."""
+    stub = HVCGroepApiStub()
+    await stub.start()
+
+    try:
+        async with async_hass() as hass:
+            with stub.patch_urls():
+                # Load the integration and its platforms with a first entry
+                create_config_entry(0).add_to_hass(hass)
+                assert await async_setup_component(hass, DOMAIN, {})
+                await hass.async_block_till_done()
+
+                entries = [create_config_entry(index) for index in range(1, count + 1)]
+                entities_before = len(hass.states.async_entity_ids("sensor"))
+                gc.collect()
+                tracemalloc.start()
+                before = tracemalloc.take_snapshot()
+
+                for entry in entries:
+                    entry.add_to_hass(hass)
+                results = await asyncio.gather(
+                    *(hass.config_entries.async_setup(entry.entry_id) for entry in entries)
+                )
+                await hass.async_block_till_done()
+
+                gc.collect()
+                after = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+
+            if not all(results):
+                raise RuntimeError(f"Only {sum(results)} of {count} entries were set up")
+
+            total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+            per_entry = total / count
+
+            print(f"Entries:           {count}")
+            entities = len(hass.states.async_entity_ids("sensor")) - entities_before
+            print(f"Entities:          {entities}")
+            print(f"Total allocated:   {total / 1024:.1f} KiB")
+            print(f"Per entry:         {per_entry:.0f} B")
+            print(f"Per 1000 entries:  {per_entry * 1000 / 1024 / 1024:.2f} MiB")
+    finally:
+        await stub.stop()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(async_main(args.entries))
+
+
+if __name__ == "__main__":
+    main()
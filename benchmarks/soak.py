@@ -0,0 +1,285 @@
+"""Accelerated-time soak test for the HVC Groep coordinators and sensors.
+
+Sets up a number of config entries against the local API stand-in and
+travels through weeks of simulated time in hourly steps. Along the way
+entries refresh, days roll over, options are changed (which reloads the
+entry through async_update_options) and the upstream API fails for whole
+days. At the end of every simulated week, integration object counts, traced
+memory and scheduled timers are recorded. The run fails when any of them
+grew between the first and last steady-state checkpoint, or when no request
+hit the API during an outage.
+
+Traced memory still grows by a few KiB a week while the pickup histories of
+the recurrence models fill up to RECURRENCE_HISTORY_SIZE dates, which is
+bounded and well below the default --max-growth-kib per entry and week.
+
+    python benchmarks/soak.py --entries 20 --weeks 8
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import sys
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from api_stub import HVCGroepApiStub
+from common import async_hass, create_config_entry
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.hvcgroep.const import (
+    CONF_DATE_SENSORS,
+    CONF_SUMMARY_SENSORS,
+    DOMAIN,
+)
+from custom_components.hvcgroep.coordinator import HVCGroepDataUpdateCoordinator
+from custom_components.hvcgroep.sensor import HVCGroepBaseSensor, HVCGroepSummarySensor
+from custom_components.hvcgroep.summary import HVCGroepSummary
+
+# Objects whose number must stay flat between checkpoints
+TRACKED_TYPES: tuple[type, ...] = (
+    HVCGroepDataUpdateCoordinator,
+    HVCGroepBaseSensor,
+    HVCGroepSummarySensor,
+    HVCGroepSummary,
+)
+
+
+@dataclass
+class Checkpoint:
+    """Resource usage at the end of a simulated week."""
+
+    week: int
+    traced: int
+    timers: int
+    bus_listeners: int
+    objects: Counter[str] = field(default_factory=Counter)
+
+
+class SimulatedClock:
+    """Clock replacing Home Assistant's time helpers during the soak."""
+
+    def __init__(self) -> None:
+        """Start the clock at the current time."""
+        self.offset = timedelta()
+
+    def utcnow(self) -> datetime:
+        """Return the simulated current time in UTC."""
+        return datetime.now(dt_util.UTC) + self.offset
+
+    def now(self, time_zone=None) -> datetime:
+        """Return the simulated current time in the given or default time zone."""
+        return self.utcnow().astimezone(time_zone or dt_util.get_default_time_zone())
+
+    @contextmanager
+    def patch(self) -> Iterator[None]:
+        """Route Home Assistant's time helpers through the simulated clock."""
+        with (
+            patch("homeassistant.util.dt.utcnow", self.utcnow),
+            patch("homeassistant.util.dt.now", self.now),
+        ):
+            yield
+
+
+def count_objects() -> Counter[str]:
+    """Count live integration objects by tracked type.
+
+    Subclasses are counted under the tracked type they derive from, so
+    swapping sensor classes through the options does not look like growth.
+    """
+    gc.collect()
+    counts: Counter[str] = Counter()
+    for obj in gc.get_objects():
+        # Walk the MRO instead of isinstance(), the ABC checks of the generic
+        # entity base classes cache every type seen and show up as traced memory
+        mro = type(obj).__mro__
+        for tracked_type in TRACKED_TYPES:
+            if tracked_type in mro:
+                counts[tracked_type.__name__] += 1
+                break
+    return counts
+
+
+def take_checkpoint(hass: HomeAssistant, week: int) -> Checkpoint:
+    """Record resource usage."""
+    objects = count_objects()
+    return Checkpoint(
+        week=week,
+        traced=tracemalloc.get_traced_memory()[0],
+        timers=sum(not handle.cancelled() for handle in hass.loop._scheduled),  # type: ignore[attr-defined]
+        bus_listeners=sum(hass.bus.async_listeners().values()),
+        objects=objects,
+    )
+
+
+def find_growth(
+    checkpoints: list[Checkpoint], entries: int, max_growth_per_entry_week: float
+) -> list[str]:
+    """Return the metrics that grew between the first and last steady-state checkpoint."""
+    failures: list[str] = []
+    metrics: dict[str, Callable[[Checkpoint], int]] = {
+        "scheduled timers": lambda checkpoint: checkpoint.timers,
+        "bus listeners": lambda checkpoint: checkpoint.bus_listeners,
+    }
+    for name in {name for checkpoint in checkpoints for name in checkpoint.objects}:
+        metrics[f"{name} objects"] = lambda checkpoint, name=name: checkpoint.objects[name]
+
+    for name, metric in metrics.items():
+        values = [metric(checkpoint) for checkpoint in checkpoints]
+        if values[-1] > values[0]:
+            failures.append(f"{name} grew from {values[0]} to {values[-1]}: {values}")
+
+    # Compare the ends only, so a flat week from GC noise does not hide a leak
+    traced = [checkpoint.traced for checkpoint in checkpoints]
+    max_growth = max_growth_per_entry_week * entries * (len(checkpoints) - 1)
+    if traced[-1] - traced[0] > max_growth:
+        failures.append(
+            f"traced memory grew by {(traced[-1] - traced[0]) / 1024:.1f} KiB, "
+            f"allowed {max_growth / 1024:.1f} KiB: "
+            f"{[round(value / 1024) for value in traced]} KiB"
+        )
+    return failures
+
+
+async def async_soak(
+    entries: int, weeks: int, warmup_weeks: int, reload_every: int, fault_every: int
+) -> tuple[list[Checkpoint], int]:
+    """Drive the integration through simulated weeks.
+
+    Returns the steady-state checkpoints and the number of API requests made
+    during outages.
+    """
+    stub = HVCGroepApiStub()
+    await stub.start()
+    clock = SimulatedClock()
+    checkpoints: list[Checkpoint] = []
+
+    try:
+        async with async_hass() as hass:
+            config_entries = [
+                create_config_entry(
+                    index, options={CONF_SUMMARY_SENSORS: index == 0}
+                )
+                for index in range(entries)
+            ]
+            for entry in config_entries:
+                entry.add_to_hass(hass)
+
+            with clock.patch(), stub.patch_urls():
+                # Trace the initial setup too, otherwise every first reload of an
+                # entry moves its objects from untraced to traced memory
+                tracemalloc.start()
+                assert await async_setup_component(hass, DOMAIN, {})
+                await hass.async_block_till_done()
+
+                # Start at midnight so day rollovers happen at whole steps
+                start = clock.now()
+                clock.offset += (
+                    start.replace(hour=0, minute=0, second=0, microsecond=0)
+                    + timedelta(days=1)
+                    - start
+                )
+
+                for hour in range(weeks * 7 * 24):
+                    day, hour_of_day = divmod(hour, 24)
+
+                    # Entries fetch about once a day, at varying hours, so a
+                    # whole day of outage is needed to hit their fetches
+                    stub.fail = day % fault_every == fault_every - 1
+
+                    if hour_of_day == 12 and day % reload_every == reload_every - 1:
+                        # Toggle an option on a rotating entry, reloading it
+                        entry = config_entries[day // reload_every % entries]
+                        hass.config_entries.async_update_entry(
+                            entry,
+                            options={
+                                **entry.options,
+                                CONF_DATE_SENSORS: not entry.options.get(CONF_DATE_SENSORS),
+                            },
+                        )
+
+                    clock.offset += timedelta(hours=1)
+                    async_fire_time_changed(hass, clock.utcnow())
+                    await hass.async_block_till_done(wait_background_tasks=True)
+
+                    if hour % (7 * 24) == 7 * 24 - 1:
+                        week = hour // (7 * 24) + 1
+                        checkpoint = take_checkpoint(hass, week)
+                        checkpoints.append(checkpoint)
+                        print(
+                            f"week {week:>3}: traced {checkpoint.traced / 1024:>9.1f} KiB, "
+                            f"timers {checkpoint.timers:>4}, "
+                            f"bus listeners {checkpoint.bus_listeners:>4}, "
+                            f"objects {dict(sorted(checkpoint.objects.items()))}"
+                            + (" (warm-up)" if week <= warmup_weeks else "")
+                        )
+
+                tracemalloc.stop()
+                print(
+                    f"API requests: {stub.requests}, "
+                    f"during outages: {stub.failed_requests}"
+                )
+    finally:
+        await stub.stop()
+
+    return checkpoints[warmup_weeks:], stub.failed_requests
+
+
+def main() -> None:
+    """Parse arguments, run the soak and check for unbounded growth."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=20)
+    parser.add_argument("--weeks", type=int, default=8)
+    parser.add_argument(
+        "--warmup-weeks",
+        type=int,
+        default=2,
+        help="weeks before steady state, until the pickup recurrence is learned",
+    )
+    parser.add_argument("--reload-every", type=int, default=3, help="days between reloads")
+    parser.add_argument("--fault-every", type=int, default=5, help="days between outages")
+    parser.add_argument(
+        "--max-growth-kib",
+        type=float,
+        default=1,
+        help="allowed traced memory growth per entry and steady-state week",
+    )
+    args = parser.parse_args()
+
+    if args.weeks - args.warmup_weeks < 2:
+        parser.error("need at least two steady-state weeks after the warm-up")
+
+    checkpoints, failed_requests = asyncio.run(
+        async_soak(
+            args.entries,
+            args.weeks,
+            args.warmup_weeks,
+            args.reload_every,
+            args.fault_every,
+        )
+    )
+
+    if not failed_requests:
+        print("\nNo API request was made during an outage, faults were not tested")
+        sys.exit(1)
+
+    if failures := find_growth(checkpoints, args.entries, args.max_growth_kib * 1024):
+        print("\nUnbounded growth detected:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+    print("\nNo unbounded growth between steady-state checkpoints")
+
+
+if __name__ == "__main__":
+    main()
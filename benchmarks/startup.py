@@ -0,0 +1,209 @@
+"""Measure HVC Groep startup time and fail when a budget is exceeded.
+
+Measures the import time of custom_components.hvcgroep in a fresh
+interpreter, then sets up 1, 100 and 1000 config entries against the local
+API stand-in and reports the time to the first entity state and the total
+async_setup_entry wall time.
+
+    python benchmarks/startup.py --sizes 1 100 1000 --budget-setup-ms 20
+
+The setup budget is a fixed allowance for loading the platforms plus a
+budget per config entry, so a single entry is not charged the one-time cost.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from functools import wraps
+
+from api_stub import HVCGroepApiStub
+from common import ROOT, async_hass, create_config_entry
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, callback
+from homeassistant.setup import async_setup_component
+
+import custom_components.hvcgroep as integration
+from custom_components.hvcgroep.const import DOMAIN
+
+# Default budgets in milliseconds, with about twice the headroom of a typical run
+DEFAULT_BUDGET_IMPORT_MS = 250.0
+DEFAULT_BUDGET_FIRST_STATE_MS = 1000.0
+DEFAULT_BUDGET_SETUP_BASE_MS = 100.0
+DEFAULT_BUDGET_SETUP_MS = 20.0
+
+# Import Home Assistant first, only the integration's own import time is measured
+IMPORT_SNIPPET = """
+import sys, time
+sys.path.insert(0, {root!r})
+import homeassistant.components.sensor
+import homeassistant.components.websocket_api
+import homeassistant.helpers.update_coordinator
+start = time.perf_counter()
+import custom_components.hvcgroep
+import custom_components.hvcgroep.sensor
+print(time.perf_counter() - start)
+"""
+
+
+@dataclass
+class StartupResult:
+    """Timings of setting up a number of config entries."""
+
+    entries: int
+    first_state: float
+    total: float
+    setup_entry_sum: float
+    setup_entry_max: float
+
+
+def measure_import(runs: int) -> float:
+    """Return the best import time of the integration over a number of runs."""
+    timings = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", IMPORT_SNIPPET.format(root=str(ROOT))],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(runs)
+    ]
+    return min(timings)
+
+
+async def async_measure_setup(count: int) -> StartupResult:
+    """Set up the given number of entries and return the timings."""
+    stub = HVCGroepApiStub()
+    await stub.start()
+    durations: list[float] = []
+    original_setup_entry = integration.async_setup_entry
+
+    @wraps(original_setup_entry)
+    async def timed_setup_entry(hass, entry):
+        start = time.perf_counter()
+        try:
+            return await original_setup_entry(hass, entry)
+        finally:
+            durations.append(time.perf_counter() - start)
+
+    try:
+        async with async_hass() as hass:
+            # Dependencies are shared with other integrations, keep them out of the timing
+            assert await async_setup_component(hass, "websocket_api", {})
+
+            for index in range(count):
+                create_config_entry(index).add_to_hass(hass)
+
+            first_state: list[float] = []
+
+            @callback
+            def _async_state_changed(event: Event) -> None:
+                """Record the time of the first integration entity state."""
+                entity_id = event.data["entity_id"]
+                if not first_state and entity_id.startswith("sensor.hvc_groep_"):
+                    first_state.append(time.perf_counter())
+
+            unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _async_state_changed)
+            integration.async_setup_entry = timed_setup_entry
+            with stub.patch_urls():
+                start = time.perf_counter()
+                assert await async_setup_component(hass, DOMAIN, {})
+                await hass.async_block_till_done()
+                total = time.perf_counter() - start
+            unsub()
+
+            loaded = len(hass.data[DOMAIN])
+            if loaded != count:
+                raise RuntimeError(f"Only {loaded} of {count} entries were set up")
+
+            return StartupResult(
+                entries=count,
+                first_state=(first_state[0] - start) if first_state else total,
+                total=total,
+                setup_entry_sum=sum(durations),
+                setup_entry_max=max(durations),
+            )
+    finally:
+        integration.async_setup_entry = original_setup_entry
+        await stub.stop()
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark and check the budgets."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--import-runs", type=int, default=5)
+    parser.add_argument(
+        "--budget-import-ms",
+        type=float,
+        default=DEFAULT_BUDGET_IMPORT_MS,
+        help="maximum import time of the integration",
+    )
+    parser.add_argument(
+        "--budget-first-state-ms",
+        type=float,
+        default=DEFAULT_BUDGET_FIRST_STATE_MS,
+        help="maximum time until the first entity state is written",
+    )
+    parser.add_argument(
+        "--budget-setup-ms",
+        type=float,
+        default=DEFAULT_BUDGET_SETUP_MS,
+        help="maximum total setup wall time per config entry",
+    )
+    parser.add_argument(
+        "--budget-setup-base-ms",
+        type=float,
+        default=DEFAULT_BUDGET_SETUP_BASE_MS,
+        help="setup wall time allowed once, on top of the budget per entry",
+    )
+    args = parser.parse_args()
+
+    failures: list[str] = []
+
+    import_ms = measure_import(args.import_runs) * 1000
+    print(f"Import custom_components.hvcgroep: {import_ms:.1f} ms")
+    if import_ms > args.budget_import_ms:
+        failures.append(
+            f"import took {import_ms:.1f} ms, budget {args.budget_import_ms:.1f} ms"
+        )
+
+    print(
+        f"{'entries':>8} {'first state ms':>15} {'total ms':>10} "
+        f"{'per entry ms':>13} {'setup_entry sum ms':>19} {'max ms':>8}"
+    )
+    for size in args.sizes:
+        result = asyncio.run(async_measure_setup(size))
+        first_state_ms = result.first_state * 1000
+        per_entry_ms = result.total * 1000 / size
+        print(
+            f"{size:>8} {first_state_ms:>15.1f} {result.total * 1000:>10.1f} "
+            f"{per_entry_ms:>13.2f} {result.setup_entry_sum * 1000:>19.1f} "
+            f"{result.setup_entry_max * 1000:>8.1f}"
+        )
+        if first_state_ms > args.budget_first_state_ms:
+            failures.append(
+                f"{size} entries: first state after {first_state_ms:.1f} ms, "
+                f"budget {args.budget_first_state_ms:.1f} ms"
+            )
+        budget_total_ms = args.budget_setup_base_ms + args.budget_setup_ms * size
+        if result.total * 1000 > budget_total_ms:
+            failures.append(
+                f"{size} entries: setup took {result.total * 1000:.1f} ms, "
+                f"budget {budget_total_ms:.1f} ms"
+            )
+
+    if failures:
+        print("\nStartup budget exceeded:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
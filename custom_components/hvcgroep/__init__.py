@@ -2,16 +2,30 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
-from .const import CONF_HOUSE_NUMBER, CONF_POSTAL_CODE, DOMAIN
-from .coordinator import HVCGroepDataUpdateCoordinator
+from .cache import HVCGroepSharedCache
+from .const import (
+    CONF_HOUSE_NUMBER,
+    CONF_POSTAL_CODE,
+    CONF_SHARED_CACHE_PATH,
+    DATA_SUMMARY,
+    DOMAIN,
+    RECURRENCE_STORAGE_VERSION,
+    SIGNAL_COORDINATORS_UPDATED,
+)
+from .coordinator import HVCGroepDataUpdateCoordinator, recurrence_storage_key
+from .summary import HVCGroepSummary
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +52,7 @@ LEGACY_PLATFORM_SCHEMA = vol.Schema(
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the HVC Groep integration from YAML."""
     hass.data.setdefault(DOMAIN, {})
+    async_register_websocket_commands(hass)
 
     # Check for legacy YAML configuration under sensor platform
     if "sensor" in config:
@@ -65,16 +80,36 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up HVC Groep from a config entry."""
+    shared_cache = None
+    if shared_cache_path := entry.options.get(CONF_SHARED_CACHE_PATH, "").strip():
+        shared_cache = HVCGroepSharedCache(hass, hass.config.path(shared_cache_path))
+
     coordinator = HVCGroepDataUpdateCoordinator(
         hass,
+        config_entry=entry,
         postal_code=entry.data[CONF_POSTAL_CODE],
         house_number=entry.data[CONF_HOUSE_NUMBER],
+        shared_cache=shared_cache,
     )
 
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    async_dispatcher_send(hass, SIGNAL_COORDINATORS_UPDATED, entry.entry_id)
+
+    # Keep the domain wide summary up to date with this entry's pickups
+    summary: HVCGroepSummary = hass.data.setdefault(DATA_SUMMARY, HVCGroepSummary())
+    address = f"{coordinator.postal_code} {coordinator.house_number}"
+
+    @callback
+    def _async_update_summary() -> None:
+        """Replace this entry's contribution to the summary."""
+        summary.async_update_entry(entry.entry_id, address, coordinator.data)
+
+    _async_update_summary()
+    entry.async_on_unload(coordinator.async_add_listener(_async_update_summary))
+    entry.async_on_unload(partial(summary.async_remove_entry, entry.entry_id))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -93,10 +128,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        async_dispatcher_send(hass, SIGNAL_COORDINATORS_UPDATED, entry.entry_id)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the learned pickup recurrence when an entry is removed."""
+    await Store(
+        hass, RECURRENCE_STORAGE_VERSION, recurrence_storage_key(entry.entry_id)
+    ).async_remove()
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate old entry."""
     _LOGGER.debug("Migrating from version %s", entry.version)
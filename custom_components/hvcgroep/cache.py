@@ -0,0 +1,206 @@
+"""Shared on-disk cache for HVC Groep API results."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import SHARED_CACHE_CLAIM_TIMEOUT, SHARED_CACHE_RETRY_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS bag_ids (
+        address TEXT PRIMARY KEY,
+        bag_id TEXT NOT NULL,
+        updated REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS schedules (
+        bag_id TEXT PRIMARY KEY,
+        payload TEXT,
+        updated REAL NOT NULL DEFAULT 0,
+        claimed REAL
+    )
+    """,
+)
+
+
+class HVCGroepSharedCache:
+    """SQLite backed cache shared between Home Assistant instances on one host.
+
+    SQLite's own file locking serializes access between processes. A schedule
+    refresh is claimed inside a write transaction, so only one instance fetches
+    a given BAG ID per interval while the others read the cached payload.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the shared cache."""
+        self._hass = hass
+        self._path = path
+        self._initialized = False
+
+    @property
+    def path(self) -> str:
+        """Return the path of the cache database."""
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the cache database, creating tables if needed."""
+        # Autocommit mode, transactions are started explicitly where needed
+        conn = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+        if not self._initialized:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._initialized = True
+        return conn
+
+    def _get_bag_id(self, address: str, ttl: float) -> str | None:
+        """Return a cached BAG ID if it is still valid."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT bag_id, updated FROM bag_ids WHERE address = ?", (address,)
+            ).fetchone()
+        if row and time.time() - row[1] < ttl:
+            bag_id: str = row[0]
+            return bag_id
+        return None
+
+    def _set_bag_id(self, address: str, bag_id: str) -> None:
+        """Store a resolved BAG ID."""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO bag_ids (address, bag_id, updated) VALUES (?, ?, ?)",
+                (address, bag_id, time.time()),
+            )
+
+    def _validate(self) -> None:
+        """Open the cache database, raising sqlite3.Error if that is not possible."""
+        with closing(self._connect()):
+            pass
+
+    def _claim_schedule(
+        self, bag_id: str, ttl: float
+    ) -> tuple[list[dict[str, Any]] | None, bool]:
+        """Return the cached schedule and whether the caller should refresh it.
+
+        Returns no payload and False while another instance holds a fresh
+        claim on a schedule that is not cached yet.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            # BEGIN IMMEDIATE takes the database write lock, so the check and
+            # the claim below are atomic across all instances sharing the file
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT payload, updated, claimed FROM schedules WHERE bag_id = ?",
+                    (bag_id,),
+                ).fetchone()
+                payload: list[dict[str, Any]] | None = (
+                    json.loads(row[0]) if row and row[0] else None
+                )
+
+                if payload is not None and now - row[1] < ttl:
+                    conn.execute("COMMIT")
+                    return payload, False
+
+                if (
+                    row
+                    and row[2] is not None
+                    and now - row[2] < SHARED_CACHE_CLAIM_TIMEOUT
+                ):
+                    # Another instance is refreshing, serve the previous payload
+                    # if there is one, otherwise the caller waits for it
+                    conn.execute("COMMIT")
+                    return payload, False
+
+                conn.execute(
+                    "INSERT INTO schedules (bag_id, claimed) VALUES (?, ?) "
+                    "ON CONFLICT(bag_id) DO UPDATE SET claimed = excluded.claimed",
+                    (bag_id, now),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return payload, True
+
+    def _set_schedule(self, bag_id: str, payload: Any) -> None:
+        """Store a schedule payload and release the refresh claim."""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO schedules (bag_id, payload, updated, claimed) "
+                "VALUES (?, ?, ?, NULL)",
+                (bag_id, json.dumps(payload), time.time()),
+            )
+
+    def _release_schedule(self, bag_id: str) -> None:
+        """Release a refresh claim without storing a payload."""
+        with closing(self._connect()) as conn:
+            conn.execute("UPDATE schedules SET claimed = NULL WHERE bag_id = ?", (bag_id,))
+
+    async def async_get_bag_id(self, address: str, ttl: float) -> str | None:
+        """Return a cached BAG ID for the address, if any."""
+        try:
+            return await self._hass.async_add_executor_job(self._get_bag_id, address, ttl)
+        except sqlite3.Error as err:
+            _LOGGER.warning("Error reading shared cache %s: %s", self._path, err)
+            return None
+
+    async def async_set_bag_id(self, address: str, bag_id: str) -> None:
+        """Store a resolved BAG ID for the address."""
+        try:
+            await self._hass.async_add_executor_job(self._set_bag_id, address, bag_id)
+        except sqlite3.Error as err:
+            _LOGGER.warning("Error writing shared cache %s: %s", self._path, err)
+
+    async def async_validate(self) -> bool:
+        """Return True if the cache database can be opened."""
+        try:
+            await self._hass.async_add_executor_job(self._validate)
+        except sqlite3.Error as err:
+            _LOGGER.error("Cannot open shared cache %s: %s", self._path, err)
+            return False
+        return True
+
+    async def async_claim_schedule(
+        self, bag_id: str, ttl: float
+    ) -> tuple[list[dict[str, Any]] | None, bool]:
+        """Return the cached schedule and whether this instance should refresh it."""
+        try:
+            # Wait while another instance fetches a schedule that is not cached
+            # yet, claims expire so this ends after SHARED_CACHE_CLAIM_TIMEOUT
+            while True:
+                payload, refresh = await self._hass.async_add_executor_job(
+                    self._claim_schedule, bag_id, ttl
+                )
+                if payload is not None or refresh:
+                    return payload, refresh
+                _LOGGER.debug("Waiting for another instance to fetch %s", bag_id)
+                await asyncio.sleep(SHARED_CACHE_RETRY_DELAY)
+        except (sqlite3.Error, ValueError) as err:
+            _LOGGER.warning("Error reading shared cache %s: %s", self._path, err)
+            return None, True
+
+    async def async_set_schedule(self, bag_id: str, payload: Any) -> None:
+        """Store a freshly fetched schedule payload."""
+        try:
+            await self._hass.async_add_executor_job(self._set_schedule, bag_id, payload)
+        except sqlite3.Error as err:
+            _LOGGER.warning("Error writing shared cache %s: %s", self._path, err)
+
+    async def async_release_schedule(self, bag_id: str) -> None:
+        """Release a refresh claim after a failed fetch."""
+        try:
+            await self._hass.async_add_executor_job(self._release_schedule, bag_id)
+        except sqlite3.Error as err:
+            _LOGGER.warning("Error writing shared cache %s: %s", self._path, err)
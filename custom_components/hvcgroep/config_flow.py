@@ -13,15 +13,21 @@ from homeassistant.config_entries import (
 )
 from homeassistant.core import callback
 
+from .cache import HVCGroepSharedCache
 from .const import (
     CONF_DATE_FORMAT_DEFAULT,
     CONF_DATE_FORMAT_TODAY,
     CONF_DATE_FORMAT_TOMORROW,
+    CONF_DATE_SENSORS,
     CONF_HOUSE_NUMBER,
     CONF_POSTAL_CODE,
+    CONF_SHARED_CACHE_PATH,
+    CONF_SUMMARY_SENSORS,
     DEFAULT_DATE_FORMAT,
     DEFAULT_DATE_FORMAT_TODAY,
     DEFAULT_DATE_FORMAT_TOMORROW,
+    DEFAULT_DATE_SENSORS,
+    DEFAULT_SUMMARY_SENSORS,
     DOMAIN,
 )
 from .coordinator import validate_connection
@@ -117,16 +123,37 @@ class HVCGroepOptionsFlow(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage the options."""
-        if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+        errors: dict[str, str] = {}
 
-        # Get current values or defaults
-        options = self.config_entry.options
+        if user_input is not None:
+            if cache_path := user_input.get(CONF_SHARED_CACHE_PATH, "").strip():
+                shared_cache = HVCGroepSharedCache(self.hass, self.hass.config.path(cache_path))
+                if not await shared_cache.async_validate():
+                    errors[CONF_SHARED_CACHE_PATH] = "cannot_open_cache"
+
+            # The summary sensors have fixed unique IDs and can only be added once
+            if user_input.get(CONF_SUMMARY_SENSORS) and any(
+                other.options.get(CONF_SUMMARY_SENSORS, DEFAULT_SUMMARY_SENSORS)
+                for other in self.hass.config_entries.async_entries(DOMAIN)
+                if other.entry_id != self.config_entry.entry_id
+            ):
+                errors[CONF_SUMMARY_SENSORS] = "summary_sensors_in_use"
+
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
+
+        # Get submitted or current values, or defaults
+        options = user_input if user_input is not None else self.config_entry.options
         current_default = options.get(CONF_DATE_FORMAT_DEFAULT, DEFAULT_DATE_FORMAT)
         current_today = options.get(CONF_DATE_FORMAT_TODAY, DEFAULT_DATE_FORMAT_TODAY)
         current_tomorrow = options.get(
             CONF_DATE_FORMAT_TOMORROW, DEFAULT_DATE_FORMAT_TOMORROW
         )
+        current_date_sensors = options.get(CONF_DATE_SENSORS, DEFAULT_DATE_SENSORS)
+        current_summary_sensors = options.get(
+            CONF_SUMMARY_SENSORS, DEFAULT_SUMMARY_SENSORS
+        )
+        current_cache_path = options.get(CONF_SHARED_CACHE_PATH, "")
 
         return self.async_show_form(
             step_id="init",
@@ -144,6 +171,19 @@ class HVCGroepOptionsFlow(OptionsFlow):
                         CONF_DATE_FORMAT_TOMORROW,
                         default=current_tomorrow,
                     ): str,
+                    vol.Optional(
+                        CONF_DATE_SENSORS,
+                        default=current_date_sensors,
+                    ): bool,
+                    vol.Optional(
+                        CONF_SUMMARY_SENSORS,
+                        default=current_summary_sensors,
+                    ): bool,
+                    vol.Optional(
+                        CONF_SHARED_CACHE_PATH,
+                        default=current_cache_path,
+                    ): str,
                 }
             ),
+            errors=errors,
         )
@@ -5,6 +5,14 @@ from typing import Final
 
 DOMAIN: Final = "hvcgroep"
 
+# hass.data key of the pickup summary shared by all config entries
+DATA_SUMMARY: Final = f"{DOMAIN}_summary"
+# hass.data key of the entry ID that created the summary sensors
+DATA_SUMMARY_OWNER: Final = f"{DOMAIN}_summary_owner"
+
+# Dispatcher signal sent with the entry ID when a coordinator is set up or unloaded
+SIGNAL_COORDINATORS_UPDATED: Final = f"{DOMAIN}_coordinators_updated"
+
 # Configuration keys
 CONF_POSTAL_CODE: Final = "postal_code"
 CONF_HOUSE_NUMBER: Final = "house_number"
@@ -19,6 +27,17 @@ DEFAULT_DATE_FORMAT: Final = "%d-%m-%Y"
 DEFAULT_DATE_FORMAT_TODAY: Final = "Today %d-%m-%Y"
 DEFAULT_DATE_FORMAT_TOMORROW: Final = "Tomorrow %d-%m-%Y"
 
+# Expose pickups as date sensors instead of formatted strings
+CONF_DATE_SENSORS: Final = "date_sensors"
+DEFAULT_DATE_SENSORS: Final = False
+
+# Add domain wide summary sensors covering all addresses
+CONF_SUMMARY_SENSORS: Final = "summary_sensors"
+DEFAULT_SUMMARY_SENSORS: Final = False
+
+# Shared cache configuration key, an empty path disables the shared cache
+CONF_SHARED_CACHE_PATH: Final = "shared_cache_path"
+
 # API URLs
 BAGID_URL: Final = "https://inzamelkalender.hvcgroep.nl/rest/adressen/{0}-{1}"
 WASTE_URL: Final = "https://inzamelkalender.hvcgroep.nl/rest/adressen/{0}/afvalstromen"
@@ -26,6 +45,24 @@ WASTE_URL: Final = "https://inzamelkalender.hvcgroep.nl/rest/adressen/{0}/afvals
 # Default scan interval in seconds (1 hour)
 DEFAULT_SCAN_INTERVAL: Final = 3600
 
+# Shared cache lifetimes in seconds
+SHARED_CACHE_BAG_ID_TTL: Final = 30 * 24 * 3600
+SHARED_CACHE_CLAIM_TIMEOUT: Final = 60
+# Delay between checks while another instance fetches an uncached schedule
+SHARED_CACHE_RETRY_DELAY: Final = 2
+
+# Recurrence model settings
+RECURRENCE_STORAGE_VERSION: Final = 1
+RECURRENCE_SAVE_DELAY: Final = 60
+# Number of successive pickup dates kept per garbage type
+RECURRENCE_HISTORY_SIZE: Final = 8
+# Number of equal intervals needed before a recurrence is trusted
+RECURRENCE_MIN_INTERVALS: Final = 2
+# Supported recurrence intervals in days (weekly up to four-weekly)
+RECURRENCE_INTERVALS: Final = (7, 14, 21, 28)
+# Maximum age in seconds of a schedule before a recurring schedule is confirmed again
+RECURRENCE_CONFIRM_INTERVAL: Final = 24 * 3600
+
 # Garbage type definitions with HVC API IDs
 GARBAGE_TYPES: Final = {
     "gft": {
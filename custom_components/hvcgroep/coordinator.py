@@ -2,46 +2,71 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any
 
 import aiohttp
 import async_timeout
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .cache import HVCGroepSharedCache
 from .const import (
     BAGID_URL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     GARBAGE_ID_TO_TYPE,
+    RECURRENCE_CONFIRM_INTERVAL,
+    RECURRENCE_SAVE_DELAY,
+    RECURRENCE_STORAGE_VERSION,
+    SHARED_CACHE_BAG_ID_TTL,
     WASTE_URL,
 )
+from .recurrence import HVCGroepRecurrenceModel
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def recurrence_storage_key(entry_id: str) -> str:
+    """Return the storage key of the recurrence model for a config entry."""
+    return f"{DOMAIN}.{entry_id}.recurrence"
+
+
 class HVCGroepDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching HVC Groep data."""
 
     def __init__(
         self,
         hass: HomeAssistant,
+        config_entry: ConfigEntry,
         postal_code: str,
         house_number: str,
+        shared_cache: HVCGroepSharedCache | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
         )
         self._postal_code = postal_code
         self._house_number = house_number
         self._bag_id: str | None = None
+        self._shared_cache = shared_cache
         self._session = async_get_clientsession(hass)
+        self._store: Store[dict[str, Any]] = Store(
+            hass, RECURRENCE_STORAGE_VERSION, recurrence_storage_key(config_entry.entry_id)
+        )
+        self._recurrence = HVCGroepRecurrenceModel()
+        self._last_payload: list[dict[str, Any]] | None = None
+        self._last_fetch: datetime | None = None
+        self._predicting = False
 
     @property
     def postal_code(self) -> str:
@@ -55,6 +80,14 @@ class HVCGroepDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _get_bag_id(self) -> str | None:
         """Get the BAG ID using postal code and house number."""
+        address = f"{self._postal_code}-{self._house_number}"
+        if self._shared_cache:
+            if bag_id := await self._shared_cache.async_get_bag_id(
+                address, SHARED_CACHE_BAG_ID_TTL
+            ):
+                _LOGGER.debug("Found BAG ID in shared cache: %s", bag_id)
+                return bag_id
+
         url = BAGID_URL.format(self._postal_code, self._house_number)
         _LOGGER.debug("Fetching BAG ID from: %s", url)
 
@@ -67,6 +100,8 @@ class HVCGroepDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if json_data and len(json_data) > 0:
                 bag_id = json_data[0].get("bagId")
                 _LOGGER.debug("Found BAG ID: %s", bag_id)
+                if bag_id and self._shared_cache:
+                    await self._shared_cache.async_set_bag_id(address, bag_id)
                 return bag_id
 
             _LOGGER.error("No BAG ID found for %s-%s", self._postal_code, self._house_number)
@@ -77,14 +112,118 @@ class HVCGroepDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except aiohttp.ClientError as err:
             raise UpdateFailed(f"Error fetching BAG ID: {err}") from err
 
+    async def _async_setup(self) -> None:
+        """Load the learned pickup recurrence."""
+        if stored := await self._store.async_load():
+            self._recurrence = HVCGroepRecurrenceModel.from_dict(stored)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from HVC Groep API."""
+        today = dt_util.now().date()
+
+        if (payload := self._confirmed_payload(today)) is not None:
+            _LOGGER.debug("Schedule confirmed at %s, skipping fetch", self._last_fetch)
+            return self._parse_waste_schedule(payload)
+
+        try:
+            json_data = await self._async_get_waste_schedule()
+        except UpdateFailed as err:
+            if not (result := self._predict_schedule(today)):
+                raise
+            if not self._predicting:
+                _LOGGER.warning(
+                    "Error fetching HVC Groep data, using predicted pickup dates: %s", err
+                )
+                self._predicting = True
+            return result
+
+        self._predicting = False
+        self._last_payload = json_data
+        self._last_fetch = dt_util.utcnow()
+        result = self._parse_waste_schedule(json_data)
+
+        changed = False
+        for garbage_type, info in result["garbage"].items():
+            predicted = self._recurrence.predict(garbage_type, today)
+            if predicted and predicted[1] and predicted[0] != info["pickup_date"]:
+                _LOGGER.debug(
+                    "Pickup of %s deviates from recurrence: predicted %s, got %s",
+                    garbage_type,
+                    predicted[0],
+                    info["pickup_date"],
+                )
+            changed |= self._recurrence.observe(garbage_type, info["pickup_date"])
+        if changed:
+            self._store.async_delay_save(self._recurrence.as_dict, RECURRENCE_SAVE_DELAY)
+
+        return result
+
+    def _confirmed_payload(self, today: date) -> list[dict[str, Any]] | None:
+        """Return the last fetched schedule if it can be reused without polling.
+
+        The last payload is reused for up to RECURRENCE_CONFIRM_INTERVAL while
+        every pickup date in it is still ahead and not predicted. The
+        recurrence model is not consulted here, it only predicts dates during
+        outages and reports deviations from the learned pattern.
+        """
+        if self._last_payload is None or self._last_fetch is None or not self.data:
+            return None
+        if dt_util.utcnow() - self._last_fetch >= timedelta(
+            seconds=RECURRENCE_CONFIRM_INTERVAL
+        ):
+            return None
+
+        garbage = self.data["garbage"]
+        if not garbage or any(
+            info["predicted"] or info["pickup_date"] < today for info in garbage.values()
+        ):
+            return None
+        return self._last_payload
+
+    def _predict_schedule(self, today: date) -> dict[str, Any] | None:
+        """Build sensor data from the recurrence model, flagging predicted dates."""
+        previous = self.data["garbage"] if self.data else {}
+        result = self._empty_result()
+
+        for garbage_type in self._recurrence.garbage_types:
+            if not (prediction := self._recurrence.predict(garbage_type, today)):
+                continue
+            pickup_date, predicted = prediction
+            title = previous.get(garbage_type, {}).get("title", "")
+            self._add_pickup(result, garbage_type, pickup_date, title, today, predicted)
+
+        return result if result["garbage"] else None
+
+    async def _async_get_waste_schedule(self) -> list[dict[str, Any]]:
+        """Get the raw waste schedule, from the shared cache when available."""
         # Get BAG ID if we don't have it yet
         if not self._bag_id:
             self._bag_id = await self._get_bag_id()
             if not self._bag_id:
                 raise UpdateFailed("Could not retrieve BAG ID")
 
+        if not self._shared_cache:
+            return await self._fetch_waste_schedule()
+
+        # Only one instance sharing the cache refreshes a BAG ID per interval
+        json_data, refresh = await self._shared_cache.async_claim_schedule(
+            self._bag_id, DEFAULT_SCAN_INTERVAL
+        )
+        if not refresh and json_data is not None:
+            _LOGGER.debug("Using waste schedule from shared cache for %s", self._bag_id)
+            return json_data
+
+        try:
+            fetched = await self._fetch_waste_schedule()
+        except UpdateFailed:
+            await self._shared_cache.async_release_schedule(self._bag_id)
+            raise
+
+        await self._shared_cache.async_set_schedule(self._bag_id, fetched)
+        return fetched
+
+    async def _fetch_waste_schedule(self) -> list[dict[str, Any]]:
+        """Fetch the raw waste schedule for the BAG ID."""
         url = WASTE_URL.format(self._bag_id)
         _LOGGER.debug("Fetching waste schedule from: %s", url)
 
@@ -92,22 +231,60 @@ class HVCGroepDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             async with async_timeout.timeout(10):
                 response = await self._session.get(url)
                 response.raise_for_status()
-                json_data = await response.json()
+                json_data: list[dict[str, Any]] = await response.json()
+                return json_data
 
         except TimeoutError as err:
             raise UpdateFailed(f"Timeout fetching waste schedule: {err}") from err
         except aiohttp.ClientError as err:
             raise UpdateFailed(f"Error fetching waste schedule: {err}") from err
 
-        # Parse the waste schedule data
-        result: dict[str, Any] = {
+    @staticmethod
+    def _empty_result() -> dict[str, Any]:
+        """Return sensor data without any pickups."""
+        return {
             "garbage": {},
             "pickup_today": [],
             "pickup_tomorrow": [],
         }
 
-        today = datetime.today().date()
-        tomorrow = today + timedelta(days=1)
+    @staticmethod
+    def _add_pickup(
+        result: dict[str, Any],
+        garbage_type: str,
+        pickup_date: date,
+        title: str,
+        today: date,
+        predicted: bool = False,
+    ) -> None:
+        """Add a pickup to the sensor data."""
+        days_until = (pickup_date - today).days
+
+        _LOGGER.debug(
+            "Garbage type: %s, pickup date: %s, days until: %d, predicted: %s",
+            garbage_type,
+            pickup_date,
+            days_until,
+            predicted,
+        )
+
+        result["garbage"][garbage_type] = {
+            "pickup_date": pickup_date,
+            "days_until": days_until,
+            "title": title,
+            "predicted": predicted,
+        }
+
+        # Track items for today/tomorrow aggregate sensors
+        if days_until == 0:
+            result["pickup_today"].append(garbage_type)
+        elif days_until == 1:
+            result["pickup_tomorrow"].append(garbage_type)
+
+    def _parse_waste_schedule(self, json_data: list[dict[str, Any]]) -> dict[str, Any]:
+        """Parse the raw waste schedule into sensor data."""
+        result = self._empty_result()
+        today = dt_util.now().date()
 
         for item in json_data:
             pickup_date_str = item.get("ophaaldatum")
@@ -127,27 +304,10 @@ class HVCGroepDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 _LOGGER.warning("Invalid date format: %s", pickup_date_str)
                 continue
 
-            days_until = (pickup_date - today).days
-
-            _LOGGER.debug(
-                "Garbage type: %s, pickup date: %s, days until: %d",
-                garbage_type,
-                pickup_date,
-                days_until,
+            self._add_pickup(
+                result, garbage_type, pickup_date, item.get("title", ""), today
             )
 
-            result["garbage"][garbage_type] = {
-                "pickup_date": pickup_date,
-                "days_until": days_until,
-                "title": item.get("title", ""),
-            }
-
-            # Track items for today/tomorrow aggregate sensors
-            if pickup_date == today:
-                result["pickup_today"].append(garbage_type)
-            elif pickup_date == tomorrow:
-                result["pickup_tomorrow"].append(garbage_type)
-
         return result
 
 
@@ -0,0 +1,88 @@
+"""Pickup recurrence model for HVC Groep garbage types."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+from itertools import pairwise
+from typing import Any
+
+from .const import RECURRENCE_HISTORY_SIZE, RECURRENCE_INTERVALS, RECURRENCE_MIN_INTERVALS
+
+
+class HVCGroepRecurrenceModel:
+    """Learn the pickup recurrence of each garbage type from observed pickup dates.
+
+    HVC Groep only reports the next pickup date per garbage type, so the
+    history is built from the successive next pickup dates seen over time.
+    A garbage type is considered recurring once its last intervals are equal
+    and match one of the supported weekly patterns.
+    """
+
+    def __init__(self, history: dict[str, list[date]] | None = None) -> None:
+        """Initialize the model."""
+        self._history: dict[str, list[date]] = history or {}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HVCGroepRecurrenceModel:
+        """Create a model from stored data."""
+        return cls(
+            {
+                garbage_type: [date.fromisoformat(value) for value in dates]
+                for garbage_type, dates in data.get("history", {}).items()
+            }
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the model as JSON serializable data for storage."""
+        return {
+            "history": {
+                garbage_type: [value.isoformat() for value in dates]
+                for garbage_type, dates in self._history.items()
+            }
+        }
+
+    @property
+    def garbage_types(self) -> list[str]:
+        """Return the garbage types with observed pickups."""
+        return list(self._history)
+
+    def observe(self, garbage_type: str, pickup_date: date) -> bool:
+        """Record an observed pickup date, return True if the history changed."""
+        dates = self._history.setdefault(garbage_type, [])
+        if dates and pickup_date <= dates[-1]:
+            if pickup_date < dates[-1]:
+                # The schedule moved back, the last observation was a deviation
+                dates[-1] = pickup_date
+                return True
+            return False
+
+        dates.append(pickup_date)
+        del dates[:-RECURRENCE_HISTORY_SIZE]
+        return True
+
+    def interval(self, garbage_type: str) -> int | None:
+        """Return the learned recurrence interval in days, if any."""
+        dates = self._history.get(garbage_type, [])
+        if len(dates) <= RECURRENCE_MIN_INTERVALS:
+            return None
+
+        recent = dates[-(RECURRENCE_MIN_INTERVALS + 1) :]
+        intervals = {(later - earlier).days for earlier, later in pairwise(recent)}
+        if len(intervals) == 1 and (interval := intervals.pop()) in RECURRENCE_INTERVALS:
+            return interval
+        return None
+
+    def predict(self, garbage_type: str, today: date) -> tuple[date, bool] | None:
+        """Return the next pickup date on or after today and whether it is predicted."""
+        dates = self._history.get(garbage_type)
+        if not dates:
+            return None
+
+        last = dates[-1]
+        if last >= today:
+            return last, False
+
+        if (interval := self.interval(garbage_type)) is None:
+            return None
+
+        periods = -(-(today - last).days // interval)
+        return last + timedelta(days=periods * interval), True
@@ -6,26 +6,36 @@ from datetime import date
 from typing import Any, ClassVar
 
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_DATE_FORMAT_DEFAULT,
     CONF_DATE_FORMAT_TODAY,
     CONF_DATE_FORMAT_TOMORROW,
+    CONF_DATE_SENSORS,
     CONF_POSTAL_CODE,
+    CONF_SUMMARY_SENSORS,
+    DATA_SUMMARY,
+    DATA_SUMMARY_OWNER,
     DEFAULT_DATE_FORMAT,
     DEFAULT_DATE_FORMAT_TODAY,
     DEFAULT_DATE_FORMAT_TOMORROW,
+    DEFAULT_DATE_SENSORS,
+    DEFAULT_SUMMARY_SENSORS,
     DOMAIN,
     GARBAGE_TYPES,
 )
 from .coordinator import HVCGroepDataUpdateCoordinator
+from .summary import HVCGroepSummary
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,6 +65,21 @@ AGGREGATE_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
 )
 
 
+# Domain wide summary sensor descriptions, keys match the summarized coordinator data
+SUMMARY_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="pickup_today",
+        translation_key="summary_pickup_today",
+        icon="mdi:calendar-today",
+    ),
+    SensorEntityDescription(
+        key="pickup_tomorrow",
+        translation_key="summary_pickup_tomorrow",
+        icon="mdi:calendar-arrow-right",
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -63,15 +88,29 @@ async def async_setup_entry(
     """Set up HVC Groep sensors based on a config entry."""
     coordinator: HVCGroepDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    # Device info - group all sensors under one device, shared by all sensors
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=f"HVC Groep ({entry.data[CONF_POSTAL_CODE]})",
+        manufacturer="HVC Groep",
+        model="Waste Collection",
+        configuration_url="https://www.hvcgroep.nl",
+    )
+
     entities: list[SensorEntity] = []
 
-    # Add garbage type sensors
+    # Add garbage type sensors, as date sensors when enabled in the options
+    garbage_sensor_class: type[HVCGroepBaseSensor] = HVCGroepGarbageSensor
+    if entry.options.get(CONF_DATE_SENSORS, DEFAULT_DATE_SENSORS):
+        garbage_sensor_class = HVCGroepGarbageDateSensor
+
     for description in GARBAGE_SENSOR_DESCRIPTIONS:
         entities.append(
-            HVCGroepGarbageSensor(
+            garbage_sensor_class(
                 coordinator=coordinator,
                 entry=entry,
                 description=description,
+                device_info=device_info,
             )
         )
 
@@ -82,12 +121,56 @@ async def async_setup_entry(
                 coordinator=coordinator,
                 entry=entry,
                 description=description,
+                device_info=device_info,
             )
         )
 
+    # Add domain wide summary sensors covering all addresses, from one entry only
+    if entry.options.get(
+        CONF_SUMMARY_SENSORS, DEFAULT_SUMMARY_SENSORS
+    ) and _async_claim_summary(hass, entry):
+        summary: HVCGroepSummary = hass.data[DATA_SUMMARY]
+        summary_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "summary")},
+            name="HVC Groep",
+            manufacturer="HVC Groep",
+            model="Waste Collection Summary",
+            configuration_url="https://www.hvcgroep.nl",
+        )
+        for description in SUMMARY_SENSOR_DESCRIPTIONS:
+            entities.append(
+                HVCGroepSummarySensor(
+                    summary=summary,
+                    description=description,
+                    device_info=summary_device_info,
+                )
+            )
+
     async_add_entities(entities)
 
 
+@callback
+def _async_claim_summary(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Claim the summary sensors for an entry, return False if another entry owns them."""
+    owner = hass.data.setdefault(DATA_SUMMARY_OWNER, entry.entry_id)
+    if owner != entry.entry_id:
+        _LOGGER.warning(
+            "Summary sensors are already added by another HVC Groep address, "
+            "not adding them for %s",
+            entry.title,
+        )
+        return False
+
+    @callback
+    def _async_release_summary() -> None:
+        """Release the summary sensors when the owning entry is unloaded."""
+        if hass.data.get(DATA_SUMMARY_OWNER) == entry.entry_id:
+            hass.data.pop(DATA_SUMMARY_OWNER)
+
+    entry.async_on_unload(_async_release_summary)
+    return True
+
+
 class HVCGroepBaseSensor(CoordinatorEntity[HVCGroepDataUpdateCoordinator], SensorEntity):
     """Base class for HVC Groep sensors."""
 
@@ -98,6 +181,7 @@ class HVCGroepBaseSensor(CoordinatorEntity[HVCGroepDataUpdateCoordinator], Senso
         coordinator: HVCGroepDataUpdateCoordinator,
         entry: ConfigEntry,
         description: SensorEntityDescription,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -106,15 +190,7 @@ class HVCGroepBaseSensor(CoordinatorEntity[HVCGroepDataUpdateCoordinator], Senso
 
         # Create unique ID
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-
-        # Device info - group all sensors under one device
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": f"HVC Groep ({entry.data[CONF_POSTAL_CODE]})",
-            "manufacturer": "HVC Groep",
-            "model": "Waste Collection",
-            "configuration_url": "https://www.hvcgroep.nl",
-        }
+        self._attr_device_info = device_info
 
 
 class HVCGroepGarbageSensor(HVCGroepBaseSensor):
@@ -160,7 +236,6 @@ class HVCGroepGarbageSensor(HVCGroepBaseSensor):
     def _get_language(self) -> str:
         """Get language code from HA language setting."""
         lang = self.coordinator.hass.config.language
-        _LOGGER.debug("HA language setting: %s", lang)
         if lang and lang.startswith("nl"):
             return "nl"
         elif lang and lang.startswith("de"):
@@ -184,7 +259,7 @@ class HVCGroepGarbageSensor(HVCGroepBaseSensor):
         if pickup_date is None:
             return None
 
-        today = date.today()
+        today = dt_util.now().date()
         return (pickup_date - today).days
 
     def _format_date(self, pickup_date: date, days_until: int) -> str:
@@ -263,13 +338,49 @@ class HVCGroepGarbageSensor(HVCGroepBaseSensor):
             days_until = self._get_days_until(pickup_date) if pickup_date else None
 
             if days_until is not None:
-                return {
+                attributes: dict[str, Any] = {
                     "days_until_pickup": days_until,
                 }
+                if type_data.get("predicted"):
+                    attributes["predicted"] = True
+                return attributes
 
         return {}
 
 
+class HVCGroepGarbageDateSensor(HVCGroepBaseSensor):
+    """Sensor exposing a garbage type pickup as a date.
+
+    The frontend renders the date relative to today, so the state only
+    changes when the pickup date itself changes and not on every day rollover.
+    """
+
+    _attr_device_class = SensorDeviceClass.DATE
+
+    def _get_type_data(self) -> dict[str, Any] | None:
+        """Return the coordinator data for this garbage type."""
+        if not self.coordinator.data:
+            return None
+        type_data: dict[str, Any] | None = self.coordinator.data.get("garbage", {}).get(
+            self.entity_description.key
+        )
+        return type_data
+
+    @property
+    def native_value(self) -> date | None:
+        """Return the pickup date."""
+        if type_data := self._get_type_data():
+            return type_data.get("pickup_date")
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        if (type_data := self._get_type_data()) and type_data.get("predicted"):
+            return {"predicted": True}
+        return {}
+
+
 class HVCGroepAggregateSensor(HVCGroepBaseSensor):
     """Sensor showing what garbage is being picked up today or tomorrow."""
 
@@ -343,3 +454,42 @@ class HVCGroepAggregateSensor(HVCGroepBaseSensor):
             "garbage_types": pickup_list,
             "count": len(pickup_list),
         }
+
+
+class HVCGroepSummarySensor(SensorEntity):
+    """Sensor counting the addresses with a pickup today or tomorrow."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    # Address lists grow with the number of entries, keep them out of the recorder
+    _unrecorded_attributes = frozenset({"addresses", "garbage_types"})
+
+    def __init__(
+        self,
+        summary: HVCGroepSummary,
+        description: SensorEntityDescription,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._summary = summary
+        self._attr_unique_id = f"{DOMAIN}_summary_{description.key}"
+        self._attr_device_info = device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to summary changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._summary.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of addresses with a pickup."""
+        return self._summary.count(self.entity_description.key)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the addresses with a pickup, also grouped by garbage type."""
+        return {
+            "addresses": self._summary.addresses(self.entity_description.key),
+            "garbage_types": self._summary.addresses_by_type(self.entity_description.key),
+        }
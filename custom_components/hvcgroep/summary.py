@@ -0,0 +1,103 @@
+"""Domain wide pickup summary for HVC Groep addresses."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+# Coordinator data keys that are summarized over all addresses
+SUMMARY_KEYS: tuple[str, ...] = ("pickup_today", "pickup_tomorrow")
+
+
+class HVCGroepSummary:
+    """Incrementally maintained pickups of all configured addresses.
+
+    Every config entry contributes the garbage types picked up today and
+    tomorrow at its address. When a coordinator updates, only the
+    contribution of that entry is replaced in the totals.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the summary."""
+        self._contributions: dict[str, tuple[str, dict[str, tuple[str, ...]]]] = {}
+        # Summary key -> garbage type -> entry ID -> address
+        self._by_type: dict[str, dict[str, dict[str, str]]] = {
+            key: {} for key in SUMMARY_KEYS
+        }
+        # Summary key -> entry ID -> address, for entries with any pickup
+        self._by_entry: dict[str, dict[str, str]] = {key: {} for key in SUMMARY_KEYS}
+        self._listeners: list[Callable[[], None]] = []
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for summary changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the summary listener."""
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update_entry(
+        self, entry_id: str, address: str, data: dict[str, Any] | None
+    ) -> None:
+        """Replace the contribution of an entry with its latest coordinator data."""
+        pickups = {key: tuple(data.get(key, ())) for key in SUMMARY_KEYS} if data else {}
+        contribution = (address, pickups)
+        if self._contributions.get(entry_id) == contribution:
+            return
+
+        self._remove_contribution(entry_id)
+        self._contributions[entry_id] = contribution
+        for key, garbage_types in pickups.items():
+            if garbage_types:
+                self._by_entry[key][entry_id] = address
+            for garbage_type in garbage_types:
+                self._by_type[key].setdefault(garbage_type, {})[entry_id] = address
+
+        self._async_notify()
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Remove the contribution of an unloaded entry."""
+        if entry_id in self._contributions:
+            self._remove_contribution(entry_id)
+            self._async_notify()
+
+    def count(self, key: str) -> int:
+        """Return the number of addresses with a pickup."""
+        return len(self._by_entry[key])
+
+    def addresses(self, key: str) -> list[str]:
+        """Return the addresses with a pickup."""
+        return sorted(self._by_entry[key].values())
+
+    def addresses_by_type(self, key: str) -> dict[str, list[str]]:
+        """Return the addresses with a pickup, grouped by garbage type."""
+        return {
+            garbage_type: sorted(addresses.values())
+            for garbage_type, addresses in self._by_type[key].items()
+        }
+
+    def _remove_contribution(self, entry_id: str) -> None:
+        """Remove the current contribution of an entry from the totals."""
+        if (contribution := self._contributions.pop(entry_id, None)) is None:
+            return
+
+        for key, garbage_types in contribution[1].items():
+            self._by_entry[key].pop(entry_id, None)
+            for garbage_type in garbage_types:
+                addresses = self._by_type[key][garbage_type]
+                del addresses[entry_id]
+                if not addresses:
+                    del self._by_type[key][garbage_type]
+
+    @callback
+    def _async_notify(self) -> None:
+        """Notify all listeners of a change."""
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -0,0 +1,153 @@
+"""Websocket API for the HVC Groep integration."""
+from __future__ import annotations
+
+from functools import partial
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, SIGNAL_COORDINATORS_UPDATED
+from .coordinator import HVCGroepDataUpdateCoordinator
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the HVC Groep websocket commands."""
+    websocket_api.async_register_command(hass, websocket_schedules)
+    websocket_api.async_register_command(hass, websocket_subscribe_schedules)
+
+
+def serialize_schedule(coordinator: HVCGroepDataUpdateCoordinator) -> dict[str, Any]:
+    """Return the parsed schedule of a coordinator in JSON serializable form."""
+    data = coordinator.data or {}
+    return {
+        "postal_code": coordinator.postal_code,
+        "house_number": coordinator.house_number,
+        "available": coordinator.last_update_success,
+        "garbage": {
+            garbage_type: {
+                "pickup_date": info["pickup_date"].isoformat(),
+                "title": info["title"],
+                "predicted": info["predicted"],
+            }
+            for garbage_type, info in data.get("garbage", {}).items()
+        },
+        "pickup_today": data.get("pickup_today", []),
+        "pickup_tomorrow": data.get("pickup_tomorrow", []),
+    }
+
+
+@callback
+def _async_get_coordinators(
+    hass: HomeAssistant, entry_ids: list[str] | None
+) -> dict[str, HVCGroepDataUpdateCoordinator]:
+    """Return the loaded coordinators, optionally limited to the given entries."""
+    coordinators: dict[str, HVCGroepDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    if entry_ids is None:
+        return dict(coordinators)
+    return {
+        entry_id: coordinators[entry_id]
+        for entry_id in entry_ids
+        if entry_id in coordinators
+    }
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hvcgroep/schedules",
+        vol.Optional("entry_ids"): [str],
+    }
+)
+@callback
+def websocket_schedules(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the schedules of all or the selected entries in one message."""
+    coordinators = _async_get_coordinators(hass, msg.get("entry_ids"))
+    connection.send_result(
+        msg["id"],
+        {
+            entry_id: serialize_schedule(coordinator)
+            for entry_id, coordinator in coordinators.items()
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hvcgroep/schedules/subscribe",
+        vol.Optional("entry_ids"): [str],
+    }
+)
+@callback
+def websocket_subscribe_schedules(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to schedules, pushing only the entries that changed."""
+    entry_ids: list[str] | None = msg.get("entry_ids")
+    last_sent: dict[str, dict[str, Any] | None] = {
+        entry_id: serialize_schedule(coordinator)
+        for entry_id, coordinator in _async_get_coordinators(hass, entry_ids).items()
+    }
+    # Entry ID -> coordinator listened to and the listener removal callback
+    listeners: dict[str, tuple[HVCGroepDataUpdateCoordinator, CALLBACK_TYPE]] = {}
+
+    @callback
+    def _async_coordinator_updated(entry_id: str) -> None:
+        """Push the schedule of an entry if it changed since it was last sent."""
+        coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+        schedule = serialize_schedule(coordinator) if coordinator else None
+        if last_sent.get(entry_id) == schedule:
+            return
+        last_sent[entry_id] = schedule
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {entry_id: schedule})
+        )
+
+    @callback
+    def _async_attach(changed_entry_id: str | None = None) -> None:
+        """Listen to the current coordinators, dropping replaced or unloaded ones."""
+        coordinators = _async_get_coordinators(hass, entry_ids)
+
+        for entry_id in list(listeners):
+            if coordinators.get(entry_id) is not listeners[entry_id][0]:
+                listeners.pop(entry_id)[1]()
+
+        for entry_id, coordinator in coordinators.items():
+            if entry_id not in listeners:
+                listeners[entry_id] = (
+                    coordinator,
+                    coordinator.async_add_listener(
+                        partial(_async_coordinator_updated, entry_id)
+                    ),
+                )
+
+        # Push the new schedule, or None when the entry was unloaded
+        if changed_entry_id is not None and (
+            changed_entry_id in coordinators or changed_entry_id in last_sent
+        ):
+            _async_coordinator_updated(changed_entry_id)
+
+    _async_attach()
+    unsub_dispatcher = async_dispatcher_connect(
+        hass, SIGNAL_COORDINATORS_UPDATED, _async_attach
+    )
+
+    @callback
+    def _async_unsubscribe() -> None:
+        """Remove all coordinator listeners."""
+        unsub_dispatcher()
+        for _, unsub in listeners.values():
+            unsub()
+        listeners.clear()
+
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(msg["id"], dict(last_sent)))
@@ -0,0 +1 @@
+"""Tests for the HVC Groep integration."""
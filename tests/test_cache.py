@@ -0,0 +1,78 @@
+"""Tests for the HVC Groep shared cache."""
+from __future__ import annotations
+
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hvcgroep.cache import HVCGroepSharedCache
+from custom_components.hvcgroep.const import SHARED_CACHE_CLAIM_TIMEOUT
+
+BAG_ID = "0402200001574396"
+TTL = 3600
+PAYLOAD = [{"id": 5, "title": "GFT", "ophaaldatum": "2024-01-15"}]
+
+
+def _create_caches(
+    hass: HomeAssistant, tmp_path: Path
+) -> tuple[HVCGroepSharedCache, HVCGroepSharedCache]:
+    """Return two caches sharing one file, like two instances on a host."""
+    path = str(tmp_path / "hvcgroep.db")
+    return HVCGroepSharedCache(hass, path), HVCGroepSharedCache(hass, path)
+
+
+def test_claim_blocks_other_instance(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a second instance waits while the first fetches an uncached schedule."""
+    first, second = _create_caches(hass, tmp_path)
+
+    assert first._claim_schedule(BAG_ID, TTL) == (None, True)
+    assert second._claim_schedule(BAG_ID, TTL) == (None, False)
+
+    first._set_schedule(BAG_ID, PAYLOAD)
+    assert second._claim_schedule(BAG_ID, TTL) == (PAYLOAD, False)
+
+
+def test_stale_payload_served_while_claimed(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the previous payload is served while another instance refreshes it."""
+    first, second = _create_caches(hass, tmp_path)
+    first._claim_schedule(BAG_ID, TTL)
+    first._set_schedule(BAG_ID, PAYLOAD)
+
+    with patch("time.time", return_value=time.time() + TTL):
+        assert first._claim_schedule(BAG_ID, TTL) == (PAYLOAD, True)
+        assert second._claim_schedule(BAG_ID, TTL) == (PAYLOAD, False)
+
+
+def test_claim_after_release(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a released claim can be taken by another instance."""
+    first, second = _create_caches(hass, tmp_path)
+    first._claim_schedule(BAG_ID, TTL)
+
+    first._release_schedule(BAG_ID)
+    assert second._claim_schedule(BAG_ID, TTL) == (None, True)
+    assert first._claim_schedule(BAG_ID, TTL) == (None, False)
+
+
+def test_claim_expires(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the claim of an instance that never finished expires."""
+    first, second = _create_caches(hass, tmp_path)
+    first._claim_schedule(BAG_ID, TTL)
+
+    with patch("time.time", return_value=time.time() + SHARED_CACHE_CLAIM_TIMEOUT - 1):
+        assert second._claim_schedule(BAG_ID, TTL) == (None, False)
+    with patch("time.time", return_value=time.time() + SHARED_CACHE_CLAIM_TIMEOUT + 1):
+        assert second._claim_schedule(BAG_ID, TTL) == (None, True)
+
+
+async def test_corrupt_payload(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a corrupt payload makes the caller refresh the schedule."""
+    cache, _ = _create_caches(hass, tmp_path)
+    cache._set_schedule(BAG_ID, PAYLOAD)
+    with closing(sqlite3.connect(cache.path)) as conn, conn:
+        conn.execute("UPDATE schedules SET payload = ? WHERE bag_id = ?", ("{", BAG_ID))
+
+    assert await cache.async_claim_schedule(BAG_ID, TTL) == (None, True)
@@ -0,0 +1,81 @@
+"""Tests for the HVC Groep pickup recurrence model."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from custom_components.hvcgroep.recurrence import HVCGroepRecurrenceModel
+
+
+def _observe_every(
+    model: HVCGroepRecurrenceModel, garbage_type: str, first: date, days: int, count: int
+) -> date:
+    """Observe a number of pickups at a fixed interval, return the last date."""
+    for index in range(count):
+        model.observe(garbage_type, first + timedelta(days=index * days))
+    return first + timedelta(days=(count - 1) * days)
+
+
+def test_weekly_recurrence() -> None:
+    """Test a weekly pickup is learned after enough intervals."""
+    model = HVCGroepRecurrenceModel()
+    _observe_every(model, "gft", date(2024, 1, 1), 7, 2)
+    assert model.interval("gft") is None
+
+    last = _observe_every(model, "gft", date(2024, 1, 15), 7, 1)
+    assert model.interval("gft") == 7
+    assert model.predict("gft", last) == (last, False)
+    assert model.predict("gft", last + timedelta(days=1)) == (
+        last + timedelta(days=7),
+        True,
+    )
+
+
+def test_biweekly_recurrence() -> None:
+    """Test a biweekly pickup is predicted across several missed periods."""
+    model = HVCGroepRecurrenceModel()
+    last = _observe_every(model, "papier", date(2024, 1, 3), 14, 4)
+
+    assert model.interval("papier") == 14
+    assert model.predict("papier", last + timedelta(days=15)) == (
+        last + timedelta(days=28),
+        True,
+    )
+
+
+def test_shifted_date() -> None:
+    """Test a shifted pickup breaks the pattern until it is regular again."""
+    model = HVCGroepRecurrenceModel()
+    last = _observe_every(model, "plastic", date(2024, 1, 2), 14, 3)
+    assert model.interval("plastic") == 14
+
+    # Holiday: the pickup moves a day later
+    shifted = last + timedelta(days=15)
+    assert model.observe("plastic", shifted)
+    assert model.interval("plastic") is None
+    assert model.predict("plastic", shifted + timedelta(days=1)) is None
+
+    # A reported date that moves back replaces the last observation
+    assert model.observe("plastic", last + timedelta(days=14))
+    assert model.interval("plastic") == 14
+    assert not model.observe("plastic", last + timedelta(days=14))
+
+
+def test_irregular_interval() -> None:
+    """Test intervals outside the supported patterns are not learned."""
+    model = HVCGroepRecurrenceModel()
+    _observe_every(model, "restafval", date(2024, 1, 1), 10, 4)
+    assert model.interval("restafval") is None
+
+
+def test_outage_prediction() -> None:
+    """Test the model predicts from its stored history without new observations."""
+    model = HVCGroepRecurrenceModel()
+    last = _observe_every(model, "gft", date(2024, 1, 1), 7, 3)
+
+    restored = HVCGroepRecurrenceModel.from_dict(model.as_dict())
+    assert restored.garbage_types == ["gft"]
+    assert restored.predict("gft", last + timedelta(days=3)) == (
+        last + timedelta(days=7),
+        True,
+    )
+    assert restored.predict("unknown", last) is None
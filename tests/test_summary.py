@@ -0,0 +1,78 @@
+"""Tests for the HVC Groep pickup summary."""
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from custom_components.hvcgroep.summary import HVCGroepSummary
+
+
+def _data(today: list[str], tomorrow: list[str] | None = None) -> dict:
+    """Return coordinator data with the given pickups."""
+    return {"pickup_today": today, "pickup_tomorrow": tomorrow or []}
+
+
+def test_replace_entry_contribution() -> None:
+    """Test an update only replaces the contribution of that entry."""
+    summary = HVCGroepSummary()
+    summary.async_update_entry("entry_1", "1234AB 1", _data(["gft"], ["papier"]))
+    summary.async_update_entry("entry_2", "1234AB 2", _data(["gft", "plastic"]))
+
+    summary.async_update_entry("entry_1", "1234AB 1", _data(["restafval"]))
+
+    assert summary.count("pickup_today") == 2
+    assert summary.addresses("pickup_today") == ["1234AB 1", "1234AB 2"]
+    assert summary.addresses_by_type("pickup_today") == {
+        "gft": ["1234AB 2"],
+        "plastic": ["1234AB 2"],
+        "restafval": ["1234AB 1"],
+    }
+    assert summary.count("pickup_tomorrow") == 0
+    assert summary.addresses_by_type("pickup_tomorrow") == {}
+
+
+def test_unchanged_data_does_not_notify() -> None:
+    """Test listeners are only called when a contribution changes."""
+    summary = HVCGroepSummary()
+    listener = Mock()
+    remove_listener = summary.async_add_listener(listener)
+
+    summary.async_update_entry("entry_1", "1234AB 1", _data(["gft"]))
+    summary.async_update_entry("entry_1", "1234AB 1", _data(["gft"]))
+    assert listener.call_count == 1
+
+    remove_listener()
+    summary.async_update_entry("entry_1", "1234AB 1", _data(["papier"]))
+    assert listener.call_count == 1
+
+
+def test_entry_without_data() -> None:
+    """Test an entry without coordinator data has no pickups."""
+    summary = HVCGroepSummary()
+    listener = Mock()
+    summary.async_add_listener(listener)
+    summary.async_update_entry("entry_1", "1234AB 1", _data(["gft"]))
+
+    summary.async_update_entry("entry_1", "1234AB 1", None)
+
+    assert listener.call_count == 2
+    assert summary.count("pickup_today") == 0
+    assert summary.addresses("pickup_today") == []
+    assert summary.addresses_by_type("pickup_today") == {}
+
+
+def test_remove_entry() -> None:
+    """Test removing an entry drops garbage types no other address has."""
+    summary = HVCGroepSummary()
+    summary.async_update_entry("entry_1", "1234AB 1", _data(["gft", "papier"]))
+    summary.async_update_entry("entry_2", "1234AB 2", _data(["gft"]))
+    listener = Mock()
+    summary.async_add_listener(listener)
+
+    summary.async_remove_entry("entry_1")
+
+    assert listener.call_count == 1
+    assert summary.addresses("pickup_today") == ["1234AB 2"]
+    assert summary.addresses_by_type("pickup_today") == {"gft": ["1234AB 2"]}
+
+    summary.async_remove_entry("entry_1")
+    assert listener.call_count == 1